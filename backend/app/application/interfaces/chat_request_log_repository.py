@@ -1,6 +1,7 @@
 """Abstract repository interface for chat request logs."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from app.domain.entities import ChatRequestLog
 
@@ -23,3 +24,10 @@ class ChatRequestLogRepository(ABC):
     ) -> list[ChatRequestLog]:
         """Retrieve chat request logs, ordered by most recent first."""
         ...
+
+    @abstractmethod
+    def iter_all(
+        self, *, skip: int = 0, limit: int | None = None
+    ) -> AsyncIterator[ChatRequestLog]:
+        """Stream chat request logs, most recent first, without materializing them."""
+        ...
@@ -1,6 +1,7 @@
 """Abstract repository interface (port) for ClientRecord persistence."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from app.domain.entities import ClientRecord
 
@@ -27,6 +28,20 @@ class ClientRecordRepository(ABC):
         """Retrieve a filtered, paginated list of records."""
         ...
 
+    @abstractmethod
+    def iter_all(
+        self,
+        *,
+        module_name: str | None = None,
+        entity_type: str | None = None,
+        parent_id: str | None = None,
+        user_id: str | None = None,
+        skip: int = 0,
+        limit: int | None = None,
+    ) -> AsyncIterator[ClientRecord]:
+        """Stream a filtered list of records without materializing it in memory."""
+        ...
+
     @abstractmethod
     async def create(self, record: ClientRecord) -> ClientRecord:
         """Persist a new record and return it."""
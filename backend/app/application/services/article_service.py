@@ -27,11 +27,14 @@ class ArticleService:
 
     async def update_article(self, article_id: int, data: ArticleUpdate) -> Article:
         article = await self.get_article(article_id)
-        article.update(title=data.title, content=data.content)
+        changes = data.model_dump(exclude_none=True)
+        if all(getattr(article, name) == value for name, value in changes.items()):
+            return article  # Nothing changed — skip the UPDATE round-trip
+        article.update(**changes)
         return await self._repository.update(article)
 
     async def delete_article(self, article_id: int) -> bool:
-        exists = await self._repository.get_by_id(article_id)
-        if exists is None:
+        deleted = await self._repository.delete(article_id)
+        if not deleted:
             raise EntityNotFoundError("Article", article_id)
-        return await self._repository.delete(article_id)
+        return deleted
@@ -200,3 +200,7 @@ class ChatCompletionService:
     ) -> list[ChatRequestLog]:
         """Retrieve chat request logs for monitoring."""
         return await self._log_repository.get_all(skip=skip, limit=limit)
+
+    def iter_logs(self) -> AsyncIterator[ChatRequestLog]:
+        """Stream every chat request log, most recent first, for export."""
+        return self._log_repository.iter_all()
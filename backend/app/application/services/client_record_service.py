@@ -1,5 +1,6 @@
 """Application service (use case) for ClientRecord operations."""
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from app.application.interfaces import ClientRecordRepository
@@ -39,6 +40,22 @@ class ClientRecordService:
             limit=limit,
         )
 
+    def iter_records(
+        self,
+        *,
+        module_name: str | None = None,
+        entity_type: str | None = None,
+        parent_id: str | None = None,
+        user_id: str | None = None,
+    ) -> AsyncIterator[ClientRecord]:
+        """Stream every matching record, newest first, without a page limit."""
+        return self._repository.iter_all(
+            module_name=module_name,
+            entity_type=entity_type,
+            parent_id=parent_id,
+            user_id=user_id,
+        )
+
     async def create_record(self, data: ClientRecordCreate) -> ClientRecord:
         record = ClientRecord(
             module_name=data.module_name,
@@ -61,11 +78,15 @@ class ClientRecordService:
         if data.parent_id is not None:
             kwargs["parent_id"] = data.parent_id
 
+        # Same values as stored: leave the row and its updated_at untouched
+        if all(getattr(record, name) == value for name, value in kwargs.items()):
+            return record
+
         record.update(**kwargs)
         return await self._repository.update(record)
 
     async def delete_record(self, record_id: str) -> bool:
-        exists = await self._repository.get_by_id(record_id)
-        if exists is None:
+        deleted = await self._repository.delete(record_id)
+        if not deleted:
             raise EntityNotFoundError("ClientRecord", record_id)
-        return await self._repository.delete(record_id)
+        return deleted
@@ -11,6 +11,15 @@ class Settings(BaseSettings):
     database_url: str = "sqlite:///./knowledge_base.db"
     cors_origins: list[str] = ["http://localhost:3020"]
 
+    # Database engine tuning
+    db_query_cache_size: int = 1200  # compiled-statement LRU entries
+    db_pool_size: int = 10  # ignored for SQLite
+    db_max_overflow: int = 20
+    # asyncpg prepared statements per connection. 0 (with unique statement names)
+    # is for PgBouncer transaction pooling but re-prepares every statement;
+    # raise it when connecting to PostgreSQL directly.
+    db_statement_cache_size: int = 0
+
     # OpenRouter configuration
     openrouter_api_key: str = ""
     openrouter_base_url: str = "https://openrouter.ai/api/v1"
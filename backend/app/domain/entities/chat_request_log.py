@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatRequestLog:
     """Represents a logged chat completion request with cost tracking.
 
@@ -1,12 +1,26 @@
 """Domain entity — pure Python business object for generic client data storage."""
 
+import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
-from uuid import uuid4
+from uuid import UUID
 
 
-@dataclass
+def _uuid7() -> UUID:
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48-bit millisecond timestamp keeps new primary keys close
+    together in the B-tree instead of scattering them like uuid4.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return UUID(int=value)
+
+
+@dataclass(slots=True)
 class ClientRecord:
     """Core domain entity for storing arbitrary frontend JSON data.
 
@@ -17,7 +31,7 @@ class ClientRecord:
     module_name: str
     entity_type: str
     data: dict[str, Any]
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: str = field(default_factory=lambda: str(_uuid7()))
     parent_id: str | None = None
     user_id: str | None = None
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
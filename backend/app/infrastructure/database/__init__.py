@@ -1,12 +1,14 @@
-from .base import Base
+from .base import Base, create_missing_indexes
 from .session import engine, async_session_factory, get_db_session
-from .models import ArticleModel, ChatRequestLogModel
+from .models import ArticleModel, ChatRequestLogModel, ClientRecordModel
 
 __all__ = [
     "Base",
+    "create_missing_indexes",
     "engine",
     "async_session_factory",
     "get_db_session",
     "ArticleModel",
     "ChatRequestLogModel",
+    "ClientRecordModel",
 ]
@@ -1,9 +1,64 @@
 """SQLAlchemy ORM base and model registry."""
 
+import logging
+
+from sqlalchemy import Connection, DateTime, func, inspect
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.expression import FunctionElement
+
+logger = logging.getLogger(__name__)
 
 
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy ORM models."""
 
     pass
+
+
+def create_missing_indexes(connection: Connection) -> None:
+    """Create declared b-tree indexes that are missing from existing tables.
+
+    create_all only emits CREATE INDEX for tables it creates itself, so
+    indexes added to a model later never reach an existing database.
+    Indexes with a PostgreSQL access method (e.g. the JSONB GIN index) are
+    left alone: they depend on column types that existing tables only get
+    through a manual ALTER, and a failed CREATE INDEX would stop startup.
+    """
+    inspector = inspect(connection)
+    for table in Base.metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            if index.dialect_options["postgresql"]["using"]:
+                if connection.dialect.name == "postgresql":
+                    logger.warning(
+                        "Index %s is missing; create it by hand once %s has the "
+                        "column types the model declares",
+                        index.name,
+                        table.name,
+                    )
+                continue
+            index.create(connection)
+
+
+class utcnow(FunctionElement):
+    """Current timestamp for server defaults, with sub-second precision.
+
+    SQLite's CURRENT_TIMESTAMP (what func.now() renders there) stops at whole
+    seconds, which makes rows created in the same second tie on created_at.
+    """
+
+    type = DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return compiler.process(func.now(), **kw)
+
+
+@compiles(utcnow, "sqlite")
+def _compile_utcnow_sqlite(element, compiler, **kw):
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
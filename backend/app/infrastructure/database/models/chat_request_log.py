@@ -1,17 +1,18 @@
 """SQLAlchemy ORM model for chat request logs."""
 
-from datetime import datetime, timezone
+from datetime import datetime
 
-from sqlalchemy import DateTime, Float, Integer, String, Text
+from sqlalchemy import DDL, DateTime, Float, Integer, String, Text, event
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.infrastructure.database.base import Base
+from app.infrastructure.database.base import Base, utcnow
 
 
 class ChatRequestLogModel(Base):
     """ORM model — maps to the 'chat_request_logs' table."""
 
     __tablename__ = "chat_request_logs"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     model: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
@@ -25,8 +26,9 @@ class ChatRequestLogModel(Base):
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=utcnow(),
         nullable=False,
+        index=True,
     )
 
     def __repr__(self) -> str:
@@ -34,3 +36,12 @@ class ChatRequestLogModel(Base):
             f"<ChatRequestLogModel(id={self.id}, model='{self.model}', "
             f"provider='{self.provider}', cost={self.cost})>"
         )
+
+
+# Request logs are append-only telemetry that can be rebuilt from provider
+# usage data, so on PostgreSQL the table skips WAL. SQLite has no equivalent.
+event.listen(
+    ChatRequestLogModel.__table__,
+    "after_create",
+    DDL("ALTER TABLE chat_request_logs SET UNLOGGED").execute_if(dialect="postgresql"),
+)
@@ -1,40 +1,54 @@
 """SQLAlchemy ORM model for the ClientRecord entity."""
 
-from datetime import datetime, timezone
+from datetime import datetime
 
 from sqlalchemy import DateTime, Index, JSON, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.infrastructure.database.base import Base
+from app.infrastructure.database.base import Base, utcnow
 
 
 class ClientRecordModel(Base):
     """ORM model — maps to the 'client_records' table."""
 
     __tablename__ = "client_records"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     module_name: Mapped[str] = mapped_column(String(100), nullable=False)
     entity_type: Mapped[str] = mapped_column(String(100), nullable=False)
-    data: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    data: Mapped[dict] = mapped_column(
+        JSON().with_variant(JSONB(), "postgresql"), nullable=False, default=dict
+    )
     parent_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
     user_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
+        server_default=utcnow(),
         nullable=False,
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
-        default=lambda: datetime.now(timezone.utc),
-        onupdate=lambda: datetime.now(timezone.utc),
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
     __table_args__ = (
-        Index("ix_client_records_scope", "module_name", "entity_type"),
-        Index("ix_client_records_parent", "parent_id"),
-        Index("ix_client_records_user", "user_id"),
+        # Each filter index ends in created_at so list queries (ORDER BY
+        # created_at DESC) read rows in order instead of sorting them.
+        Index("ix_client_records_scope_created", "module_name", "entity_type", "created_at"),
+        Index("ix_client_records_parent_created", "parent_id", "created_at"),
+        Index("ix_client_records_user_created", "user_id", "created_at"),
+        Index("ix_client_records_created", "created_at"),
+        # jsonb_path_ops serves `data @> ...` containment lookups with a smaller index
+        Index(
+            "ix_client_records_data_gin",
+            "data",
+            postgresql_using="gin",
+            postgresql_ops={"data": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
     def __repr__(self) -> str:
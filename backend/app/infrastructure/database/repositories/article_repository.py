@@ -1,6 +1,9 @@
 """Concrete repository implementation backed by SQLAlchemy."""
 
-from sqlalchemy import select
+from dataclasses import fields
+from operator import attrgetter
+
+from sqlalchemy import bindparam, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.interfaces import ArticleRepository
@@ -8,6 +11,22 @@ from app.domain.entities import Article
 from app.infrastructure.database.models import ArticleModel
 
 
+# Reads every column in Article field order in a single C-level call, so
+# _to_entity can build the entity positionally.
+_ARTICLE_FIELDS = attrgetter(*(f.name for f in fields(Article)))
+
+# Fixed-shape statements are built once; only their bind values vary per call.
+# Listings select plain columns: read-only rows skip ORM instance construction
+# and identity-map bookkeeping.
+_GET_ALL_STMT = (
+    select(*ArticleModel.__table__.c)
+    .order_by(ArticleModel.created_at.desc(), ArticleModel.id.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_DELETE_STMT = delete(ArticleModel).where(ArticleModel.id == bindparam("article_id"))
+
+
 class SQLAlchemyArticleRepository(ArticleRepository):
     """Implements the ArticleRepository port using SQLAlchemy async sessions."""
 
@@ -15,14 +34,8 @@ class SQLAlchemyArticleRepository(ArticleRepository):
         self._session = session
 
     def _to_entity(self, model: ArticleModel) -> Article:
-        """Map ORM model → domain entity."""
-        return Article(
-            id=model.id,
-            title=model.title,
-            content=model.content,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
+        """Map ORM model (or a column row from a listing query) → domain entity."""
+        return Article(*_ARTICLE_FIELDS(model))
 
     def _to_model(self, entity: Article) -> ArticleModel:
         """Map domain entity → ORM model (for creation)."""
@@ -36,9 +49,8 @@ class SQLAlchemyArticleRepository(ArticleRepository):
         return self._to_entity(result) if result else None
 
     async def get_all(self, skip: int = 0, limit: int = 100) -> list[Article]:
-        stmt = select(ArticleModel).offset(skip).limit(limit).order_by(ArticleModel.created_at.desc())
-        result = await self._session.execute(stmt)
-        return [self._to_entity(row) for row in result.scalars().all()]
+        result = await self._session.execute(_GET_ALL_STMT, {"skip": skip, "limit": limit})
+        return [self._to_entity(row) for row in result]
 
     async def create(self, article: Article) -> Article:
         model = self._to_model(article)
@@ -47,18 +59,17 @@ class SQLAlchemyArticleRepository(ArticleRepository):
         return self._to_entity(model)
 
     async def update(self, article: Article) -> Article:
-        model = await self._session.get(ArticleModel, article.id)
+        stmt = (
+            update(ArticleModel)
+            .where(ArticleModel.id == article.id)
+            .values(title=article.title, content=article.content)
+            .returning(ArticleModel)
+        )
+        model = (await self._session.execute(stmt)).scalar_one_or_none()
         if model is None:
             raise ValueError(f"Article {article.id} not found in database")
-        model.title = article.title
-        model.content = article.content
-        await self._session.flush()
         return self._to_entity(model)
 
     async def delete(self, article_id: int) -> bool:
-        model = await self._session.get(ArticleModel, article_id)
-        if model is None:
-            return False
-        await self._session.delete(model)
-        await self._session.flush()
-        return True
+        result = await self._session.execute(_DELETE_STMT, {"article_id": article_id})
+        return result.rowcount > 0
@@ -1,6 +1,10 @@
 """Concrete repository for chat request logs backed by SQLAlchemy."""
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+from dataclasses import fields
+from operator import attrgetter
+
+from sqlalchemy import bindparam, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.interfaces import ChatRequestLogRepository
@@ -8,6 +12,19 @@ from app.domain.entities import ChatRequestLog
 from app.infrastructure.database.models.chat_request_log import ChatRequestLogModel
 
 
+_LOG_FIELDS = attrgetter(*(f.name for f in fields(ChatRequestLog)))
+
+_GET_ALL_STMT = (
+    select(*ChatRequestLogModel.__table__.c)
+    .order_by(ChatRequestLogModel.created_at.desc(), ChatRequestLogModel.id.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+# Rows fetched per server-side cursor batch when streaming
+_STREAM_BATCH_SIZE = 500
+
+
 class SQLAlchemyChatRequestLogRepository(ChatRequestLogRepository):
     """Implements the ChatRequestLogRepository port using SQLAlchemy."""
 
@@ -15,49 +32,48 @@ class SQLAlchemyChatRequestLogRepository(ChatRequestLogRepository):
         self._session = session
 
     def _to_entity(self, model: ChatRequestLogModel) -> ChatRequestLog:
-        """Map ORM model → domain entity."""
-        return ChatRequestLog(
-            id=model.id,
-            model=model.model,
-            provider=model.provider,
-            prompt_tokens=model.prompt_tokens,
-            completion_tokens=model.completion_tokens,
-            total_tokens=model.total_tokens,
-            cost=model.cost,
-            duration_ms=model.duration_ms,
-            status=model.status,
-            error_message=model.error_message,
-            created_at=model.created_at,
-        )
+        """Map ORM model (or a RETURNING/listing row) → domain entity."""
+        return ChatRequestLog(*_LOG_FIELDS(model))
 
-    def _to_model(self, entity: ChatRequestLog) -> ChatRequestLogModel:
-        """Map domain entity → ORM model."""
-        return ChatRequestLogModel(
-            model=entity.model,
-            provider=entity.provider,
-            prompt_tokens=entity.prompt_tokens,
-            completion_tokens=entity.completion_tokens,
-            total_tokens=entity.total_tokens,
-            cost=entity.cost,
-            duration_ms=entity.duration_ms,
-            status=entity.status,
-            error_message=entity.error_message,
-        )
+    def _to_values(self, entity: ChatRequestLog) -> dict:
+        """Map domain entity → INSERT values (id and created_at are server-generated)."""
+        return {
+            "model": entity.model,
+            "provider": entity.provider,
+            "prompt_tokens": entity.prompt_tokens,
+            "completion_tokens": entity.completion_tokens,
+            "total_tokens": entity.total_tokens,
+            "cost": entity.cost,
+            "duration_ms": entity.duration_ms,
+            "status": entity.status,
+            "error_message": entity.error_message,
+        }
 
     async def create(self, log: ChatRequestLog) -> ChatRequestLog:
-        model = self._to_model(log)
-        self._session.add(model)
-        await self._session.flush()
-        return self._to_entity(model)
+        # Core INSERT ... RETURNING: one round-trip, no unit-of-work bookkeeping
+        stmt = (
+            insert(ChatRequestLogModel)
+            .values(self._to_values(log))
+            .returning(*ChatRequestLogModel.__table__.c)
+        )
+        row = (await self._session.execute(stmt)).one()
+        return self._to_entity(row)
 
     async def get_all(
         self, *, skip: int = 0, limit: int = 100
     ) -> list[ChatRequestLog]:
+        result = await self._session.execute(_GET_ALL_STMT, {"skip": skip, "limit": limit})
+        return [self._to_entity(row) for row in result]
+
+    async def iter_all(
+        self, *, skip: int = 0, limit: int | None = None
+    ) -> AsyncIterator[ChatRequestLog]:
         stmt = (
-            select(ChatRequestLogModel)
+            select(*ChatRequestLogModel.__table__.c)
+            .order_by(ChatRequestLogModel.created_at.desc(), ChatRequestLogModel.id.desc())
             .offset(skip)
             .limit(limit)
-            .order_by(ChatRequestLogModel.created_at.desc())
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
         )
-        result = await self._session.execute(stmt)
-        return [self._to_entity(row) for row in result.scalars().all()]
+        async for row in await self._session.stream(stmt):
+            yield self._to_entity(row)
@@ -1,6 +1,10 @@
 """Concrete repository implementation for ClientRecord backed by SQLAlchemy."""
 
-from sqlalchemy import select
+from collections.abc import AsyncIterator
+from dataclasses import fields
+from operator import attrgetter
+
+from sqlalchemy import Select, bindparam, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.application.interfaces import ClientRecordRepository
@@ -8,6 +12,14 @@ from app.domain.entities import ClientRecord
 from app.infrastructure.database.models import ClientRecordModel
 
 
+_RECORD_FIELDS = attrgetter(*(f.name for f in fields(ClientRecord)))
+
+_DELETE_STMT = delete(ClientRecordModel).where(ClientRecordModel.id == bindparam("record_id"))
+
+# Rows fetched per server-side cursor batch when streaming
+_STREAM_BATCH_SIZE = 500
+
+
 class SQLAlchemyClientRecordRepository(ClientRecordRepository):
     """Implements the ClientRecordRepository port using SQLAlchemy async sessions."""
 
@@ -15,20 +27,11 @@ class SQLAlchemyClientRecordRepository(ClientRecordRepository):
         self._session = session
 
     def _to_entity(self, model: ClientRecordModel) -> ClientRecord:
-        """Map ORM model → domain entity."""
-        return ClientRecord(
-            id=model.id,
-            module_name=model.module_name,
-            entity_type=model.entity_type,
-            data=model.data,
-            parent_id=model.parent_id,
-            user_id=model.user_id,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
+        """Map ORM model (or a column row from a listing query) → domain entity."""
+        return ClientRecord(*_RECORD_FIELDS(model))
 
     def _to_model(self, entity: ClientRecord) -> ClientRecordModel:
-        """Map domain entity → ORM model (for creation)."""
+        """Map domain entity → ORM model (for creation; timestamps are server-generated)."""
         return ClientRecordModel(
             id=entity.id,
             module_name=entity.module_name,
@@ -36,25 +39,22 @@ class SQLAlchemyClientRecordRepository(ClientRecordRepository):
             data=entity.data,
             parent_id=entity.parent_id,
             user_id=entity.user_id,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
         )
 
     async def get_by_id(self, record_id: str) -> ClientRecord | None:
         result = await self._session.get(ClientRecordModel, record_id)
         return self._to_entity(result) if result else None
 
-    async def get_all(
+    def _list_stmt(
         self,
         *,
-        module_name: str | None = None,
-        entity_type: str | None = None,
-        parent_id: str | None = None,
-        user_id: str | None = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> list[ClientRecord]:
-        stmt = select(ClientRecordModel)
+        module_name: str | None,
+        entity_type: str | None,
+        parent_id: str | None,
+        user_id: str | None,
+    ) -> Select:
+        """Build the filtered, newest-first listing query shared by get_all/iter_all."""
+        stmt = select(*ClientRecordModel.__table__.c)
 
         if module_name is not None:
             stmt = stmt.where(ClientRecordModel.module_name == module_name)
@@ -65,32 +65,68 @@ class SQLAlchemyClientRecordRepository(ClientRecordRepository):
         if user_id is not None:
             stmt = stmt.where(ClientRecordModel.user_id == user_id)
 
-        stmt = stmt.offset(skip).limit(limit).order_by(
-            ClientRecordModel.created_at.desc()
-        )
+        return stmt.order_by(ClientRecordModel.created_at.desc())
+
+    async def get_all(
+        self,
+        *,
+        module_name: str | None = None,
+        entity_type: str | None = None,
+        parent_id: str | None = None,
+        user_id: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[ClientRecord]:
+        stmt = self._list_stmt(
+            module_name=module_name,
+            entity_type=entity_type,
+            parent_id=parent_id,
+            user_id=user_id,
+        ).offset(skip).limit(limit)
         result = await self._session.execute(stmt)
-        return [self._to_entity(row) for row in result.scalars().all()]
+        return [self._to_entity(row) for row in result]
+
+    async def iter_all(
+        self,
+        *,
+        module_name: str | None = None,
+        entity_type: str | None = None,
+        parent_id: str | None = None,
+        user_id: str | None = None,
+        skip: int = 0,
+        limit: int | None = None,
+    ) -> AsyncIterator[ClientRecord]:
+        stmt = self._list_stmt(
+            module_name=module_name,
+            entity_type=entity_type,
+            parent_id=parent_id,
+            user_id=user_id,
+        ).offset(skip).limit(limit).execution_options(yield_per=_STREAM_BATCH_SIZE)
+        # Server-side cursor: rows are mapped as they arrive, not collected first
+        async for row in await self._session.stream(stmt):
+            yield self._to_entity(row)
 
     async def create(self, record: ClientRecord) -> ClientRecord:
         model = self._to_model(record)
         self._session.add(model)
+        # Flush inside the request so INSERT errors fail it, rather than
+        # surfacing at commit after the response has already been sent;
+        # eager_defaults reads the server timestamps back in the same INSERT
         await self._session.flush()
         return self._to_entity(model)
 
     async def update(self, record: ClientRecord) -> ClientRecord:
-        model = await self._session.get(ClientRecordModel, record.id)
+        stmt = (
+            update(ClientRecordModel)
+            .where(ClientRecordModel.id == record.id)
+            .values(data=record.data, parent_id=record.parent_id)
+            .returning(ClientRecordModel)
+        )
+        model = (await self._session.execute(stmt)).scalar_one_or_none()
         if model is None:
             raise ValueError(f"ClientRecord {record.id} not found in database")
-        model.data = record.data
-        model.parent_id = record.parent_id
-        model.updated_at = record.updated_at
-        await self._session.flush()
         return self._to_entity(model)
 
     async def delete(self, record_id: str) -> bool:
-        model = await self._session.get(ClientRecordModel, record_id)
-        if model is None:
-            return False
-        await self._session.delete(model)
-        await self._session.flush()
-        return True
+        result = await self._session.execute(_DELETE_STMT, {"record_id": record_id})
+        return result.rowcount > 0
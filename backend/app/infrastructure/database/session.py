@@ -1,10 +1,15 @@
 """SQLAlchemy database session and engine configuration."""
 
+import json
+import re
 from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import uuid4
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.config import get_settings
+from app.config import Settings, get_settings
 
 
 def _get_async_url(url: str) -> str:
@@ -16,14 +21,75 @@ def _get_async_url(url: str) -> str:
     return url
 
 
+# orjson reads integers beyond 64 bits as floats; any run of digits that long
+# sends the document through the stdlib parser instead
+_LONG_DIGITS = re.compile(r"\d{19,}")
+
+
+def _json_dumps(value: Any) -> str:
+    """orjson-backed serializer for JSON/JSONB columns (drivers expect str).
+
+    Falls back to the stdlib for values orjson refuses, such as integers
+    beyond 64 bits.
+    """
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        return json.dumps(value)
+
+
+def _json_loads(text: str) -> Any:
+    """orjson-backed deserializer, using the stdlib where orjson would be lossy."""
+    if _LONG_DIGITS.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN/Infinity written by the stdlib encoder
+    return json.loads(text)
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def _get_engine_options(url: str, settings: Settings) -> dict[str, Any]:
+    """Build driver-specific engine options for an async URL.
+
+    SQLite keeps SQLAlchemy's default pool: it serialises writers anyway,
+    so a larger pool only adds idle file handles.
+    """
+    options: dict[str, Any] = {
+        "echo": settings.app_env == "development",
+        "future": True,
+        "query_cache_size": settings.db_query_cache_size,
+        "json_serializer": _json_dumps,
+        "json_deserializer": _json_loads,
+    }
+    if url.startswith("sqlite"):
+        return options
+
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+    )
+    if url.startswith("postgresql+asyncpg"):
+        connect_args: dict[str, Any] = {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+        }
+        if not settings.db_statement_cache_size:
+            # SQLAlchemy still prepares each statement; asyncpg's numbered
+            # names would collide across PgBouncer-shared server connections
+            connect_args["prepared_statement_name_func"] = _unique_statement_name
+        options["connect_args"] = connect_args
+    return options
+
+
 settings = get_settings()
 _async_url = _get_async_url(settings.database_url)
 
-engine = create_async_engine(
-    _async_url,
-    echo=(settings.app_env == "development"),
-    future=True,
-)
+engine = create_async_engine(_async_url, **_get_engine_options(_async_url, settings))
 
 async_session_factory = async_sessionmaker(
     engine,
@@ -33,11 +99,11 @@ async_session_factory = async_sessionmaker(
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI dependency — yields an async DB session per request."""
-    async with async_session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
+    """FastAPI dependency — yields an async DB session per request.
+
+    The whole request runs in one transaction: committed when the handler
+    returns, rolled back if it raises. FastAPI caches the dependency, so
+    every service on a route shares this session.
+    """
+    async with async_session_factory() as session, session.begin():
+        yield session
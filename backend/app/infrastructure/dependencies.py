@@ -1,7 +1,10 @@
 """FastAPI dependency injection — wires infrastructure to application layer."""
 
+import asyncio
 from collections.abc import AsyncGenerator
+from weakref import WeakKeyDictionary
 
+import httpx
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,6 +19,36 @@ from app.infrastructure.database.repositories import (
 from app.infrastructure.openrouter import OpenRouterClient
 
 
+# httpx connections are bound to the event loop that opened them, so the
+# shared client is kept per loop; entries go away with their loop.
+_openrouter_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, OpenRouterClient] = (
+    WeakKeyDictionary()
+)
+
+
+def get_openrouter_client() -> OpenRouterClient:
+    """OpenRouter client for the running event loop, so requests reuse pooled connections."""
+    loop = asyncio.get_running_loop()
+    client = _openrouter_clients.get(loop)
+    if client is None:
+        settings = get_settings()
+        client = OpenRouterClient(
+            api_key=settings.openrouter_api_key,
+            base_url=settings.openrouter_base_url,
+            app_name=settings.openrouter_app_name,
+            http_client=httpx.AsyncClient(timeout=120.0),
+        )
+        _openrouter_clients[loop] = client
+    return client
+
+
+async def close_openrouter_client() -> None:
+    """Close the running loop's OpenRouter client if one was created."""
+    client = _openrouter_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 async def get_article_service(
     session: AsyncSession = Depends(get_db_session),
 ) -> AsyncGenerator[ArticleService, None]:
@@ -32,12 +65,7 @@ async def get_chat_completion_service(
     The provider can be swapped out for Groq, OpenAI, etc. by creating
     alternative dependency functions or using a provider registry.
     """
-    settings = get_settings()
-    provider = OpenRouterClient(
-        api_key=settings.openrouter_api_key,
-        base_url=settings.openrouter_base_url,
-        app_name=settings.openrouter_app_name,
-    )
+    provider = get_openrouter_client()
     log_repository = SQLAlchemyChatRequestLogRepository(session)
     yield ChatCompletionService(provider=provider, log_repository=log_repository)
 
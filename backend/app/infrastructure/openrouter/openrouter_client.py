@@ -99,6 +99,11 @@ class OpenRouterClient(ChatProvider):
             return self._http_client
         return httpx.AsyncClient(timeout=120.0)
 
+    async def aclose(self) -> None:
+        """Close the injected HTTP client, if any."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+
     async def complete(
         self,
         messages: list[ChatMessage],
@@ -7,16 +7,19 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
-from app.infrastructure.database import Base, engine
+from app.infrastructure.database import Base, create_missing_indexes, engine
+from app.infrastructure.dependencies import close_openrouter_client
 from app.presentation.api.router import router as api_router
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    """Application lifespan — create tables on startup."""
+    """Application lifespan — create tables on startup, release clients on shutdown."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_missing_indexes)
     yield
+    await close_openrouter_client()
 
 
 def create_app() -> FastAPI:
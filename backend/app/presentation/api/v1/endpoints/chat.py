@@ -10,6 +10,7 @@ from app.application.schemas import (
     TokenUsageResponse,
 )
 from app.application.services import ChatCompletionService
+from app.domain.entities import ChatRequestLog
 from app.domain.exceptions import ChatProviderError
 from app.infrastructure.dependencies import get_chat_completion_service
 
@@ -96,19 +97,37 @@ async def get_chat_logs(
     ordered by most recent first, including token usage and cost.
     """
     logs = await service.get_logs(skip=skip, limit=limit)
-    return [
-        ChatRequestLogResponse(
-            id=log.id,
-            model=log.model,
-            provider=log.provider,
-            prompt_tokens=log.prompt_tokens,
-            completion_tokens=log.completion_tokens,
-            total_tokens=log.total_tokens,
-            cost=log.cost,
-            duration_ms=log.duration_ms,
-            status=log.status,
-            error_message=log.error_message,
-            created_at=log.created_at.isoformat(),
-        )
-        for log in logs
-    ]
+    return [_to_log_response(log) for log in logs]
+
+
+@router.get("/logs/export")
+async def export_chat_logs(
+    service: ChatCompletionService = Depends(get_chat_completion_service),
+) -> StreamingResponse:
+    """Export all chat request logs as newline-delimited JSON.
+
+    Rows are read from a server-side cursor and written out as they
+    arrive, so the full log table is never held in memory.
+    """
+
+    async def line_generator():
+        async for log in service.iter_logs():
+            yield _to_log_response(log).model_dump_json() + "\n"
+
+    return StreamingResponse(line_generator(), media_type="application/x-ndjson")
+
+
+def _to_log_response(log: ChatRequestLog) -> ChatRequestLogResponse:
+    return ChatRequestLogResponse(
+        id=log.id,
+        model=log.model,
+        provider=log.provider,
+        prompt_tokens=log.prompt_tokens,
+        completion_tokens=log.completion_tokens,
+        total_tokens=log.total_tokens,
+        cost=log.cost,
+        duration_ms=log.duration_ms,
+        status=log.status,
+        error_message=log.error_message,
+        created_at=log.created_at.isoformat(),
+    )
@@ -1,6 +1,7 @@
 """Client record CRUD endpoints."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.application.schemas.client_record import (
     ClientRecordCreate,
@@ -38,6 +39,34 @@ async def list_records(
     ]
 
 
+@router.get("/export")
+async def export_records(
+    module_name: str | None = Query(None, description="Filter by module name"),
+    entity_type: str | None = Query(None, description="Filter by entity type"),
+    parent_id: str | None = Query(None, description="Filter by parent record ID"),
+    user_id: str | None = Query(None, description="Filter by user ID"),
+    service: ClientRecordService = Depends(get_client_record_service),
+) -> StreamingResponse:
+    """Export all matching client records as newline-delimited JSON.
+
+    Unlike the list endpoint this has no page limit: rows are streamed
+    from a server-side cursor as they are read.
+    """
+
+    async def line_generator():
+        async for record in service.iter_records(
+            module_name=module_name,
+            entity_type=entity_type,
+            parent_id=parent_id,
+            user_id=user_id,
+        ):
+            yield ClientRecordResponse.model_validate(
+                record, from_attributes=True
+            ).model_dump_json() + "\n"
+
+    return StreamingResponse(line_generator(), media_type="application/x-ndjson")
+
+
 @router.get("/{record_id}", response_model=ClientRecordResponse)
 async def get_record(
     record_id: str,
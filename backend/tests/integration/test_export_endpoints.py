@@ -0,0 +1,79 @@
+"""Tests for the NDJSON export endpoints."""
+
+import json
+from collections.abc import AsyncIterator
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.domain.entities import ChatRequestLog
+from app.infrastructure.database import Base, get_db_session
+from app.infrastructure.database.repositories import SQLAlchemyChatRequestLogRepository
+from app.main import app
+
+
+@pytest.fixture
+async def factory() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_session() -> AsyncIterator[AsyncSession]:
+        async with factory() as session, session.begin():
+            yield session
+
+    app.dependency_overrides[get_db_session] = override_session
+    yield factory
+    app.dependency_overrides.pop(get_db_session, None)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(factory) -> AsyncIterator[AsyncClient]:
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+def _ndjson(text: str) -> list[dict]:
+    assert text.endswith("\n")
+    return [json.loads(line) for line in text.splitlines()]
+
+
+@pytest.mark.asyncio
+async def test_export_chat_logs_streams_ndjson(factory, client: AsyncClient):
+    """Chat log export returns one JSON object per line, most recent first."""
+    async with factory() as session, session.begin():
+        repository = SQLAlchemyChatRequestLogRepository(session)
+        await repository.create(ChatRequestLog(model="model-1", provider="fake"))
+        await repository.create(ChatRequestLog(model="model-2", provider="fake"))
+
+    response = await client.get("/api/v1/chat/logs/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [log["model"] for log in _ndjson(response.text)] == ["model-2", "model-1"]
+
+
+@pytest.mark.asyncio
+async def test_export_client_records_applies_filters(client: AsyncClient):
+    """Client record export streams only matching records as NDJSON."""
+    for module_name, n in [("setup", 1), ("other", 2), ("setup", 3)]:
+        created = await client.post(
+            "/api/v1/client-records",
+            json={"module_name": module_name, "entity_type": "t", "data": {"n": n}},
+        )
+        assert created.status_code == 201
+
+    response = await client.get(
+        "/api/v1/client-records/export", params={"module_name": "setup"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    records = _ndjson(response.text)
+    assert sorted(r["data"]["n"] for r in records) == [1, 3]
+    assert {r["module_name"] for r in records} == {"setup"}
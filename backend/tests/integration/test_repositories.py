@@ -0,0 +1,208 @@
+"""Integration tests for the SQLAlchemy repositories against in-memory SQLite."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.domain.entities import Article, ChatRequestLog, ClientRecord
+from app.config import Settings
+from app.infrastructure.database.base import Base, create_missing_indexes
+from app.infrastructure.database.repositories import (
+    SQLAlchemyArticleRepository,
+    SQLAlchemyChatRequestLogRepository,
+    SQLAlchemyClientRecordRepository,
+)
+from app.infrastructure.database.session import _get_engine_options
+
+
+@pytest.fixture
+async def session() -> AsyncIterator[AsyncSession]:
+    url = "sqlite+aiosqlite:///:memory:"
+    engine = create_async_engine(url, **_get_engine_options(url, Settings(app_env="test")))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_article_create_returns_server_timestamps(session: AsyncSession):
+    repository = SQLAlchemyArticleRepository(session)
+    article = await repository.create(Article(title="T", content="C"))
+    assert article.id is not None
+    assert article.created_at is not None
+    assert article.updated_at is not None
+
+
+@pytest.mark.asyncio
+async def test_articles_created_back_to_back_list_newest_first(session: AsyncSession):
+    repository = SQLAlchemyArticleRepository(session)
+    first = await repository.create(Article(title="First", content="C"))
+    second = await repository.create(Article(title="Second", content="C"))
+
+    assert second.created_at >= first.created_at
+    assert [a.id for a in await repository.get_all()] == [second.id, first.id]
+
+
+@pytest.mark.asyncio
+async def test_article_update_and_delete(session: AsyncSession):
+    repository = SQLAlchemyArticleRepository(session)
+    created = await repository.create(Article(title="Old", content="C"))
+    loaded = await repository.get_by_id(created.id)
+    loaded.update(title="New")
+    updated = await repository.update(loaded)
+    assert updated.title == "New"
+    assert updated.updated_at is not None
+    assert (await repository.get_by_id(created.id)).title == "New"
+
+    assert await repository.delete(created.id) is True
+    assert await repository.get_by_id(created.id) is None
+    assert await repository.delete(created.id) is False
+
+
+@pytest.mark.asyncio
+async def test_article_update_missing_raises(session: AsyncSession):
+    repository = SQLAlchemyArticleRepository(session)
+    with pytest.raises(ValueError):
+        await repository.update(Article(title="T", content="C", id=999))
+
+
+@pytest.mark.asyncio
+async def test_chat_request_log_create_and_list(session: AsyncSession):
+    repository = SQLAlchemyChatRequestLogRepository(session)
+    created = await repository.create(
+        ChatRequestLog(model="m", provider="p", total_tokens=3, cost=0.5)
+    )
+    assert created.id is not None
+    assert created.created_at is not None
+
+    logs = await repository.get_all()
+    assert [log.id for log in logs] == [created.id]
+    assert logs[0].total_tokens == 3
+
+
+@pytest.mark.asyncio
+async def test_client_record_crud(session: AsyncSession):
+    repository = SQLAlchemyClientRecordRepository(session)
+    record = await repository.create(
+        ClientRecord(module_name="setup", entity_type="theme", data={"a": 1}, user_id="u1")
+    )
+
+    fetched = await repository.get_by_id(record.id)
+    assert fetched is not None
+    assert fetched.data == {"a": 1}
+
+    records = await repository.get_all(module_name="setup", user_id="u1")
+    assert [r.id for r in records] == [record.id]
+    assert await repository.get_all(module_name="other") == []
+
+    record.update(data={"a": 2})
+    updated = await repository.update(record)
+    assert updated.data == {"a": 2}
+
+    assert await repository.delete(record.id) is True
+    assert await repository.get_by_id(record.id) is None
+
+
+@pytest.mark.asyncio
+async def test_client_record_timestamps_come_from_the_database(session: AsyncSession):
+    repository = SQLAlchemyClientRecordRepository(session)
+    created = await repository.create(ClientRecord(module_name="m", entity_type="t", data={}))
+    session.expunge_all()
+    stored = await repository.get_by_id(created.id)
+    assert (created.created_at, created.updated_at) == (stored.created_at, stored.updated_at)
+
+    await asyncio.sleep(0.002)
+    stored.update(data={"a": 1})
+    updated = await repository.update(stored)
+    assert updated.created_at == created.created_at
+    assert updated.updated_at > created.updated_at
+
+
+@pytest.mark.asyncio
+async def test_client_record_stores_integers_beyond_64_bits(session: AsyncSession):
+    repository = SQLAlchemyClientRecordRepository(session)
+    record = await repository.create(
+        ClientRecord(module_name="m", entity_type="t", data={"n": 2**70})
+    )
+    session.expunge_all()
+
+    fetched = await repository.get_by_id(record.id)
+    assert fetched.data == {"n": 2**70}
+
+
+@pytest.mark.asyncio
+async def test_client_record_create_raises_insert_errors(session: AsyncSession):
+    repository = SQLAlchemyClientRecordRepository(session)
+    record = await repository.create(ClientRecord(module_name="m", entity_type="t", data={}))
+
+    with pytest.raises(IntegrityError):
+        await repository.create(
+            ClientRecord(module_name="m", entity_type="t", data={}, id=record.id)
+        )
+
+
+@pytest.mark.asyncio
+async def test_client_record_iter_all_streams_filtered_records(session: AsyncSession):
+    repository = SQLAlchemyClientRecordRepository(session)
+    for i in range(3):
+        await repository.create(
+            ClientRecord(module_name="setup", entity_type="theme", data={"i": i})
+        )
+    await repository.create(ClientRecord(module_name="other", entity_type="theme", data={}))
+
+    streamed = [r async for r in repository.iter_all(module_name="setup")]
+    listed = await repository.get_all(module_name="setup")
+    assert [r.id for r in streamed] == [r.id for r in listed]
+    assert len(streamed) == 3
+
+    limited = [r async for r in repository.iter_all(module_name="setup", limit=2)]
+    assert len(limited) == 2
+
+
+@pytest.mark.asyncio
+async def test_chat_request_log_iter_all_matches_get_all(session: AsyncSession):
+    repository = SQLAlchemyChatRequestLogRepository(session)
+    for i in range(3):
+        await repository.create(ChatRequestLog(model=f"m{i}", provider="p"))
+
+    streamed = [log async for log in repository.iter_all()]
+    assert [log.id for log in streamed] == [log.id for log in await repository.get_all()]
+    assert len([log async for log in repository.iter_all(skip=1, limit=1)]) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_missing_indexes_backfills_existing_tables(session: AsyncSession):
+    connection = await session.connection()
+    await connection.execute(text("DROP INDEX ix_client_records_created"))
+
+    await connection.run_sync(create_missing_indexes)
+    await connection.run_sync(create_missing_indexes)  # idempotent
+
+    names = await connection.run_sync(
+        lambda conn: {i["name"] for i in inspect(conn).get_indexes("client_records")}
+    )
+    assert "ix_client_records_created" in names
+
+
+@pytest.mark.asyncio
+async def test_create_missing_indexes_skips_postgresql_method_indexes(
+    session: AsyncSession, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    connection = await session.connection()
+    # Pose as PostgreSQL so the GIN index is no longer filtered out by ddl_if
+    monkeypatch.setattr(connection.dialect, "name", "postgresql")
+
+    await connection.run_sync(create_missing_indexes)
+
+    names = await connection.run_sync(
+        lambda conn: {i["name"] for i in inspect(conn).get_indexes("client_records")}
+    )
+    assert "ix_client_records_data_gin" not in names
+    assert "ix_client_records_data_gin" in caplog.text
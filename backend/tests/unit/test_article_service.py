@@ -84,3 +84,17 @@ async def test_delete_article(service: ArticleService):
     assert result is True
     with pytest.raises(EntityNotFoundError):
         await service.get_article(created.id)
+
+
+@pytest.mark.asyncio
+async def test_delete_article_not_found(service: ArticleService):
+    with pytest.raises(EntityNotFoundError):
+        await service.delete_article(999)
+
+
+@pytest.mark.asyncio
+async def test_update_article_without_changes_keeps_timestamp(service: ArticleService):
+    created = await service.create_article(ArticleCreate(title="Same", content="Body"))
+    original_updated_at = created.updated_at
+    updated = await service.update_article(created.id, ArticleUpdate(title="Same"))
+    assert updated.updated_at == original_updated_at
@@ -83,6 +83,13 @@ class FakeChatRequestLogRepository(ChatRequestLogRepository):
     ) -> list[ChatRequestLog]:
         return list(reversed(self._logs))[skip : skip + limit]
 
+    async def iter_all(
+        self, *, skip: int = 0, limit: int | None = None
+    ) -> AsyncIterator[ChatRequestLog]:
+        end = None if limit is None else skip + limit
+        for log in list(reversed(self._logs))[skip:end]:
+            yield log
+
 
 # ── Fixtures ──
 
@@ -214,6 +221,19 @@ async def test_get_logs_returns_entries():
     assert len(logs) == 2
 
 
+@pytest.mark.asyncio
+async def test_iter_logs_streams_most_recent_first():
+    """Log export streams every entry, most recent first."""
+    log_repo = FakeChatRequestLogRepository()
+    service = ChatCompletionService(provider=FakeChatProvider(), log_repository=log_repo)
+
+    await log_repo.create(ChatRequestLog(model="model-1", provider="fake"))
+    await log_repo.create(ChatRequestLog(model="model-2", provider="fake"))
+
+    logs = [log async for log in service.iter_logs()]
+    assert [log.model for log in logs] == ["model-2", "model-1"]
+
+
 @pytest.mark.asyncio
 async def test_multimodal_message_conversion():
     """Multimodal messages with text + image are correctly converted."""
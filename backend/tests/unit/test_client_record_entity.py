@@ -0,0 +1,24 @@
+"""Unit tests for ClientRecord id generation."""
+
+import time
+from uuid import RFC_4122, UUID
+
+from app.domain.entities import ClientRecord
+
+
+def _new_id() -> str:
+    return ClientRecord(module_name="m", entity_type="t", data={}).id
+
+
+def test_ids_are_uuid7():
+    record_id = UUID(_new_id())
+    assert record_id.version == 7
+    assert record_id.variant == RFC_4122
+
+
+def test_ids_sort_in_creation_order_across_milliseconds():
+    first = _new_id()
+    time.sleep(0.002)
+    second = _new_id()
+    assert first < second
+    assert UUID(first) < UUID(second)
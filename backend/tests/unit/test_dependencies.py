@@ -0,0 +1,48 @@
+"""Unit tests for the shared OpenRouter client dependency."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.infrastructure.dependencies import close_openrouter_client, get_openrouter_client
+
+
+@pytest.fixture
+def created_http_clients(monkeypatch: pytest.MonkeyPatch) -> list[httpx.AsyncClient]:
+    created: list[httpx.AsyncClient] = []
+
+    class RecordingAsyncClient(httpx.AsyncClient):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(httpx, "AsyncClient", RecordingAsyncClient)
+    return created
+
+
+@pytest.mark.asyncio
+async def test_openrouter_client_is_shared_and_closed(created_http_clients):
+    client = get_openrouter_client()
+    assert get_openrouter_client() is client
+    assert len(created_http_clients) == 1
+
+    await close_openrouter_client()
+    assert created_http_clients[0].is_closed
+    assert get_openrouter_client() is not client
+    await close_openrouter_client()
+
+
+def test_openrouter_client_is_per_event_loop(created_http_clients):
+    async def use_client() -> bool:
+        client = get_openrouter_client()
+        try:
+            return get_openrouter_client() is client
+        finally:
+            await close_openrouter_client()
+
+    # Each asyncio.run call gets a fresh loop, like TestClient requests
+    assert asyncio.run(use_client())
+    assert asyncio.run(use_client())
+    assert len(created_http_clients) == 2
+    assert all(c.is_closed for c in created_http_clients)
@@ -0,0 +1,50 @@
+"""Unit tests for the database engine option builder."""
+
+from app.config import Settings
+from app.infrastructure.database.session import (
+    _get_async_url,
+    _get_engine_options,
+    _json_dumps,
+    _json_loads,
+)
+
+
+def test_sqlite_keeps_default_pool():
+    url = _get_async_url("sqlite:///./test.db")
+    options = _get_engine_options(url, Settings())
+    assert url.startswith("sqlite+aiosqlite")
+    assert "pool_size" not in options
+    assert "connect_args" not in options
+
+
+def test_asyncpg_gets_sized_pool_and_statement_cache():
+    settings = Settings(db_pool_size=4, db_max_overflow=2, db_statement_cache_size=256)
+    url = _get_async_url("postgresql://user:pw@localhost/kb")
+    options = _get_engine_options(url, settings)
+    assert options["pool_size"] == 4
+    assert options["max_overflow"] == 2
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"]["statement_cache_size"] == 256
+    assert "prepared_statement_name_func" not in options["connect_args"]
+
+
+def test_asyncpg_statement_cache_disabled_by_default():
+    url = _get_async_url("postgresql://user:pw@localhost/kb")
+    options = _get_engine_options(url, Settings())
+    connect_args = options["connect_args"]
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+
+    name_func = connect_args["prepared_statement_name_func"]
+    assert name_func().startswith("__asyncpg_")
+    assert name_func() != name_func()
+
+
+def test_json_round_trips_integers_beyond_64_bits():
+    value = {"n": 2**70, "m": -(2**64), "small": 1}
+    assert _json_loads(_json_dumps(value)) == value
+    assert isinstance(_json_loads(_json_dumps(value))["n"], int)
+
+
+def test_json_dumps_stringifies_non_str_keys_like_stdlib():
+    assert _json_loads(_json_dumps({1: "a"})) == {"1": "a"}